@@ -19,32 +19,276 @@ Date strategy (in priority order):
 Note: Steps 3 and 4 are assumptions. If you want strict accuracy, remove them.
 """
 
+import os
 import re
 import html
 import json
+import functools
+import threading
+import http.client
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from urllib.request import Request, urlopen
+from typing import Callable, TypeVar
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import (
+    HTTPRedirectHandler,
+    Request,
+    build_opener,
+    getproxies,
+    proxy_bypass,
+)
 
 BLOG_URL = "https://easconsultinggroup.com/eas-blog/"
 MAX_ITEMS = 30
+MAX_WORKERS = 16
+MAX_REDIRECTS = 5
 
 USER_AGENT = "Mozilla/5.0 (RSS generator; GitHub Pages)"
 
+T = TypeVar("T")
+
+# Conditional-GET cache carried between runs (restored by the workflow)
+CACHE_PATH = "http_cache.json"
+
+# Listing page: <h2 ...><a href="POST_URL">POST_TITLE</a></h2>
+_H2_LINK_RE = re.compile(
+    r"<h2[^>]*>\s*<a[^>]*href=\"(https://easconsultinggroup\.com/[^\"]+)\"[^>]*>(.*?)</a>\s*</h2>",
+    re.IGNORECASE | re.DOTALL,
+)
+# Full dates commonly shown on EAS blog listing pages
+_FULL_DATE_RE = re.compile(
+    r"\b([A-Z][a-z]{2}\s+\d{1,2},\s+\d{4}|[A-Z][a-z]+\s+\d{1,2},\s+\d{4})\b"
+)
+_H2_OPEN_RE = re.compile(r"<h2[\s>]", re.IGNORECASE)
+_TAG_STRIP_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# Post page metadata
+_OG_PUBLISHED_RE = re.compile(
+    r'<meta[^>]+(?P<attr>property|name)="article:published_time"[^>]+content="(?P<content>[^"]+)"',
+    re.IGNORECASE,
+)
+_LDJSON_RE = re.compile(
+    r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE,
+)
+_TIME_RE = re.compile(r'<time[^>]*datetime="([^"]+)"', re.IGNORECASE)
+_DATE_MY_RE = re.compile(r"\bDate:\s*([A-Z][a-z]+)\s+(\d{4})\b", re.IGNORECASE)
+
+# English day/month names, independent of the process locale
+_DAY_ABBRS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+# Month name or abbreviation -> month number, for the date parsers
+_MONTHS = {
+    **{name.lower(): i for i, name in enumerate(_MONTH_NAMES, 1)},
+    **{name[:3].lower(): i for i, name in enumerate(_MONTH_NAMES, 1)},
+}
+
+# Idle keep-alive connections, keyed by (scheme, host). Every post lives on the
+# same host as the listing, so reusing connections skips a TCP+TLS handshake
+# per fetch.
+_POOL: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _acquire(scheme: str, netloc: str) -> http.client.HTTPConnection:
+    with _POOL_LOCK:
+        idle = _POOL.get((scheme, netloc))
+        if idle:
+            return idle.pop()
+    if scheme == "https":
+        return http.client.HTTPSConnection(netloc, timeout=30)
+    return http.client.HTTPConnection(netloc, timeout=30)
+
+
+def _release(scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+    with _POOL_LOCK:
+        _POOL.setdefault((scheme, netloc), []).append(conn)
+
+
+class _NoRedirect(HTTPRedirectHandler):
+    # Hand 3xx back to the caller (as HTTPError) so fetch() follows them itself
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+def _get_via_urlopen(url: str, req_headers: dict[str, str]) -> tuple[int, str, http.client.HTTPMessage, bytes]:
+    # build_opener's ProxyHandler picks up the *_proxy environment variables,
+    # the same way urlopen does
+    opener = build_opener(_NoRedirect)
+    try:
+        with opener.open(Request(url, headers=req_headers), timeout=30) as resp:
+            return resp.status, resp.reason, resp.headers, resp.read()
+    except HTTPError as e:
+        with e:
+            return e.code, e.reason, e.headers, e.read()
+
+
+def _get(url: str, extra_headers: dict[str, str]) -> tuple[int, str, http.client.HTTPMessage, bytes]:
+    """
+    Single GET over a pooled connection, without following redirects.
+    Returns (status, reason, headers, body).
+
+    The pool talks to the origin directly, so when HTTP(S)_PROXY applies to
+    the URL the request goes through urllib instead, as it did before.
+    """
+    req_headers = {"User-Agent": USER_AGENT, **extra_headers}
+    parts = urlsplit(url)
+    if parts.scheme in getproxies() and not proxy_bypass(parts.hostname or ""):
+        return _get_via_urlopen(url, req_headers)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    conn = _acquire(parts.scheme, parts.netloc)
+    try:
+        try:
+            conn.request("GET", path, headers=req_headers)
+            resp = conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionError):
+            # The server dropped an idle keep-alive connection; reconnect once
+            conn.close()
+            conn.request("GET", path, headers=req_headers)
+            resp = conn.getresponse()
+        body = resp.read()
+    except Exception:
+        conn.close()
+        raise
+
+    if resp.will_close:
+        conn.close()
+    else:
+        _release(parts.scheme, parts.netloc, conn)
+    return resp.status, resp.reason, resp.headers, body
+
+
+# url -> {"etag", "last_modified", "body", "pub_dt"?}. _CACHE holds what was
+# loaded from disk; _CACHE_OUT collects entries seen this run, so pages that
+# dropped off the listing are pruned when the cache is saved.
+_CACHE: dict[str, dict[str, str]] = {}
+_CACHE_OUT: dict[str, dict[str, str]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def load_cache(path: str = CACHE_PATH) -> None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return
+    if not isinstance(data, dict):
+        return
+    # A hand-edited or truncated cache must never stop the feed from building:
+    # keep only well-formed entries and let everything else be refetched
+    for url, entry in data.items():
+        if (
+            isinstance(entry, dict)
+            and isinstance(entry.get("body"), str)
+            and all(isinstance(v, str) for v in entry.values())
+        ):
+            _CACHE[url] = entry
+
+
+def save_cache(path: str = CACHE_PATH) -> None:
+    tmp = path + ".tmp"
+    with _CACHE_LOCK:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_CACHE_OUT, f)
+    os.replace(tmp, path)
+
 
 def fetch(url: str) -> str:
-    req = Request(url, headers={"User-Agent": USER_AGENT})
-    with urlopen(req, timeout=30) as resp:
-        return resp.read().decode("utf-8", errors="replace")
+    """
+    GET url and return the decoded body.
+
+    Sends If-None-Match / If-Modified-Since when the page is cached from a
+    previous run; a 304 returns the cached body without transferring it.
+    """
+    return _fetch_with_status(url)[0]
+
+
+def _fetch_with_status(url: str) -> tuple[str, bool]:
+    """
+    Implementation of fetch(); also reports whether the server answered 304
+    (body unchanged since the cached copy).
+    """
+    with _CACHE_LOCK:
+        cached = _CACHE.get(url)
+    validators: dict[str, str] = {}
+    if cached:
+        if cached.get("etag"):
+            validators["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            validators["If-Modified-Since"] = cached["last_modified"]
+
+    target = url
+    for _ in range(MAX_REDIRECTS + 1):
+        status, reason, headers, body = _get(target, validators)
+        location = headers.get("Location")
+        if status in (301, 302, 303, 307, 308) and location:
+            target = urljoin(target, location)
+            continue
+        if status == 304 and cached:
+            with _CACHE_LOCK:
+                _CACHE_OUT[url] = cached
+            return cached["body"], True
+        if status >= 400:
+            raise HTTPError(target, status, reason, headers, None)
+
+        text = body.decode("utf-8", errors="replace")
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag or last_modified:
+            with _CACHE_LOCK:
+                _CACHE_OUT[url] = {
+                    "etag": etag or "",
+                    "last_modified": last_modified or "",
+                    "body": text,
+                }
+        return text, False
+    raise HTTPError(target, status, "Too many redirects", headers, None)
+
+
+def fetch_many(urls: list[str], fetcher: Callable[[str], T]) -> list[T | Exception]:
+    """
+    Run fetcher(url) for several URLs concurrently.
+
+    Results come back in input order; a failed fetch yields its exception
+    instead of raising, so one bad post doesn't sink the whole batch.
+    """
+    results: list[T | Exception] = [Exception("not fetched")] * len(urls)
+    if not urls:
+        return results
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(urls))) as ex:
+        fut = {ex.submit(fetcher, url): i for i, url in enumerate(urls)}
+        for f in as_completed(fut):
+            try:
+                results[fut[f]] = f.result()
+            except Exception as e:
+                results[fut[f]] = e
+    return results
 
 
 def rfc2822(dt: datetime) -> str:
-    return dt.astimezone(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S %z")
+    # Built by hand: RFC 2822 needs English day/month names, which strftime
+    # only gives under a C/English locale
+    u = dt.astimezone(timezone.utc)
+    return (
+        f"{_DAY_ABBRS[u.weekday()]}, {u.day:02d} {_MONTH_NAMES[u.month - 1][:3]} {u.year} "
+        f"{u.hour:02d}:{u.minute:02d}:{u.second:02d} +0000"
+    )
 
 
 def now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+@functools.lru_cache(maxsize=256)
 def parse_full_date_to_dt(date_text: str) -> datetime | None:
     """
     Accepts:
@@ -53,6 +297,18 @@ def parse_full_date_to_dt(date_text: str) -> datetime | None:
     Returns UTC datetime at 00:00:00, or None if unparsable.
     """
     s = " ".join(date_text.strip().split())
+
+    # Fast path for the expected shape; anything odd goes through strptime
+    parts = s.split(" ")
+    if len(parts) == 3 and parts[1].endswith(","):
+        month = _MONTHS.get(parts[0].lower())
+        day, year = parts[1][:-1], parts[2]
+        if month and day.isdigit() and len(day) <= 2 and year.isdigit() and len(year) == 4:
+            try:
+                return datetime(int(year), month, int(day), tzinfo=timezone.utc)
+            except ValueError:
+                pass
+
     fmts = ["%b %d, %Y", "%B %d, %Y"]
     for fmt in fmts:
         try:
@@ -64,6 +320,7 @@ def parse_full_date_to_dt(date_text: str) -> datetime | None:
     return None
 
 
+@functools.lru_cache(maxsize=256)
 def parse_month_year_to_dt(month_year_text: str) -> datetime | None:
     """
     Accepts:
@@ -72,6 +329,18 @@ def parse_month_year_to_dt(month_year_text: str) -> datetime | None:
     ASSUMPTION: returns first day of month at 00:00:00 UTC.
     """
     s = " ".join(month_year_text.strip().split())
+
+    # Fast path for the expected shape; anything odd goes through strptime
+    parts = s.split(" ")
+    if len(parts) == 2:
+        month = _MONTHS.get(parts[0].lower())
+        year = parts[1]
+        if month and year.isdigit() and len(year) == 4:
+            try:
+                return datetime(int(year), month, 1, tzinfo=timezone.utc)
+            except ValueError:
+                pass
+
     fmts = ["%B %Y", "%b %Y"]
     for fmt in fmts:
         try:
@@ -82,6 +351,7 @@ def parse_month_year_to_dt(month_year_text: str) -> datetime | None:
     return None
 
 
+@functools.lru_cache(maxsize=256)
 def iso_to_dt(iso_str: str) -> datetime | None:
     """
     Parses ISO strings like:
@@ -105,34 +375,26 @@ def iso_to_dt(iso_str: str) -> datetime | None:
             return None
 
 
-def extract_posts_from_listing(listing_html: str) -> list[tuple[str, str, datetime | None]]:
+def extract_posts_from_listing(
+    listing_html: str, max_items: int = MAX_ITEMS
+) -> list[tuple[str, str, datetime | None]]:
     """
-    Extract (title, url, pub_dt_or_none) from listing page.
+    Extract up to max_items (title, url, pub_dt_or_none) from listing page.
 
     It locates:
       <h2 ...><a href="POST_URL">POST_TITLE</a></h2>
-    Then looks ahead in nearby text for full dates like:
+    Then looks ahead in nearby text (up to the next <h2>) for full dates like:
       'Mar 9, 2023' or 'September 18, 2025'
     """
-    h2_link = re.compile(
-        r"<h2[^>]*>\s*<a[^>]*href=\"(https://easconsultinggroup\.com/[^\"]+)\"[^>]*>(.*?)</a>\s*</h2>",
-        re.IGNORECASE | re.DOTALL,
-    )
-
-    # Full dates commonly shown on EAS blog listing pages
-    full_date_pat = re.compile(
-        r"\b([A-Z][a-z]{2}\s+\d{1,2},\s+\d{4}|[A-Z][a-z]+\s+\d{1,2},\s+\d{4})\b"
-    )
-
     posts: list[tuple[str, str, datetime | None]] = []
     seen = set()
 
-    for m in h2_link.finditer(listing_html):
+    for m in _H2_LINK_RE.finditer(listing_html):
         url = m.group(1).split("#")[0].strip()
 
         raw_title = m.group(2)
-        title = re.sub(r"<[^>]+>", "", raw_title)
-        title = html.unescape(re.sub(r"\s+", " ", title)).strip()
+        title = _TAG_STRIP_RE.sub("", raw_title)
+        title = html.unescape(_WS_RE.sub(" ", title)).strip()
 
         # Skip obvious non-content endpoints
         if url.endswith("/feed/") or url.endswith("/comments/feed/") or "/wp-json/" in url:
@@ -140,10 +402,15 @@ def extract_posts_from_listing(listing_html: str) -> list[tuple[str, str, dateti
         if url.rstrip("/") == BLOG_URL.rstrip("/"):
             continue
 
-        # Look near the title for a full date string
-        window = listing_html[m.end() : m.end() + 1000]
+        # Look near the title for a full date string, but stop at the next
+        # post's <h2> so a post without a date doesn't borrow its neighbour's.
+        # Searching in place with pos/endpos avoids copying a window out.
+        end = m.end() + 1000
+        nm = _H2_OPEN_RE.search(listing_html, m.end(), end)
+        if nm:
+            end = nm.start()
         pub_dt = None
-        dm = full_date_pat.search(window)
+        dm = _FULL_DATE_RE.search(listing_html, m.end(), end)
         if dm:
             pub_dt = parse_full_date_to_dt(dm.group(1))
 
@@ -151,6 +418,8 @@ def extract_posts_from_listing(listing_html: str) -> list[tuple[str, str, dateti
         if title and key not in seen:
             seen.add(key)
             posts.append((title, url, pub_dt))
+            if len(posts) >= max_items:
+                break
 
     return posts
 
@@ -165,46 +434,36 @@ def try_extract_pub_dt_from_post(post_html: str) -> datetime | None:
       3) <time datetime="...">
       4) Text 'Date: January 2026' (ASSUMPTION: first of month)
     """
-    # 1) OpenGraph
-    m = re.search(
-        r'<meta[^>]+property="article:published_time"[^>]+content="([^"]+)"',
-        post_html,
-        re.IGNORECASE,
-    )
-    if m:
-        dt = iso_to_dt(m.group(1))
-        if dt:
-            return dt
-
-    m = re.search(
-        r'<meta[^>]+name="article:published_time"[^>]+content="([^"]+)"',
-        post_html,
-        re.IGNORECASE,
-    )
-    if m:
-        dt = iso_to_dt(m.group(1))
-        if dt:
-            return dt
-
-    # 2) JSON-LD datePublished
-    for block in re.findall(
-        r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>',
-        post_html,
-        re.DOTALL | re.IGNORECASE,
-    ):
-        try:
-            data = json.loads(block.strip())
-            objs = data if isinstance(data, list) else [data]
-            for obj in objs:
-                if isinstance(obj, dict) and "datePublished" in obj:
-                    dt = iso_to_dt(str(obj["datePublished"]))
-                    if dt:
-                        return dt
-        except Exception:
-            pass
+    # 1) OpenGraph: first property= tag, then first name= tag, from one scan
+    first: dict[str, str] = {}
+    for m in _OG_PUBLISHED_RE.finditer(post_html):
+        first.setdefault(m.group("attr").lower(), m.group("content"))
+        if len(first) == 2:
+            break
+    for attr in ("property", "name"):
+        if attr in first:
+            dt = iso_to_dt(first[attr])
+            if dt:
+                return dt
+
+    # 2) JSON-LD datePublished. The key lookup below is case-sensitive, so a
+    # page without the literal "datePublished" can't match; skip the scan.
+    if "datePublished" in post_html:
+        # finditer so blocks after the first hit are never scanned or parsed
+        for m in _LDJSON_RE.finditer(post_html):
+            try:
+                data = json.loads(m.group(1).strip())
+                objs = data if isinstance(data, list) else [data]
+                for obj in objs:
+                    if isinstance(obj, dict) and "datePublished" in obj:
+                        dt = iso_to_dt(str(obj["datePublished"]))
+                        if dt:
+                            return dt
+            except Exception:
+                pass
 
     # 3) <time datetime="...">
-    m = re.search(r'<time[^>]*datetime="([^"]+)"', post_html, re.IGNORECASE)
+    m = _TIME_RE.search(post_html)
     if m:
         dt = iso_to_dt(m.group(1))
         if dt:
@@ -212,11 +471,7 @@ def try_extract_pub_dt_from_post(post_html: str) -> datetime | None:
 
     # 4) Month-year text like "Date: January 2026"
     # ASSUMPTION: first day of that month
-    m = re.search(
-        r"\bDate:\s*([A-Z][a-z]+)\s+(\d{4})\b",
-        post_html,
-        re.IGNORECASE,
-    )
+    m = _DATE_MY_RE.search(post_html)
     if m:
         dt = parse_month_year_to_dt(f"{m.group(1)} {m.group(2)}")
         if dt:
@@ -225,52 +480,73 @@ def try_extract_pub_dt_from_post(post_html: str) -> datetime | None:
     return None
 
 
+def fetch_pub_dt(url: str) -> datetime | None:
+    """
+    Fetch a post page and extract its publish datetime.
+
+    When the page is unchanged since the last run (304), the date extracted
+    then is reused and the cached body isn't parsed again.
+    """
+    post_html, not_modified = _fetch_with_status(url)
+    with _CACHE_LOCK:
+        entry = _CACHE_OUT.get(url)
+    if not_modified and entry and entry.get("pub_dt"):
+        dt = iso_to_dt(entry["pub_dt"])
+        if dt is not None:
+            return dt
+
+    dt = try_extract_pub_dt_from_post(post_html)
+    if dt is not None and entry is not None:
+        with _CACHE_LOCK:
+            entry["pub_dt"] = dt.isoformat()
+    return dt
+
+
 def main() -> int:
+    load_cache()
     listing_html = fetch(BLOG_URL)
-    posts = extract_posts_from_listing(listing_html)[:MAX_ITEMS]
+    posts = extract_posts_from_listing(listing_html, MAX_ITEMS)
 
     build_dt = now_utc()
 
-    rss_items: list[str] = []
-    for title, link, pub_dt in posts:
-        # If listing date missing, try post page extraction
-        if pub_dt is None:
-            try:
-                post_html = fetch(link)
-                extracted = try_extract_pub_dt_from_post(post_html)
-                if extracted is not None:
-                    pub_dt = extracted
-            except Exception:
-                pass
+    # If listing date missing, try post page extraction (fetched concurrently).
+    # When every listing entry carried a date, no post page is requested.
+    to_fetch = [(i, link) for i, (_, link, dt) in enumerate(posts) if dt is None]
+    print(f"Fetching {len(to_fetch)} of {len(posts)} posts for dates")
+    extracted_dts = fetch_many([link for _, link in to_fetch], fetch_pub_dt)
+    for (i, _), extracted in zip(to_fetch, extracted_dts):
+        if isinstance(extracted, datetime):
+            title, link, _ = posts[i]
+            posts[i] = (title, link, extracted)
+
+    # ElementTree handles all escaping, so no field can be escaped twice
+    rss = ET.Element("rss", version="2.0")
+    channel = ET.SubElement(rss, "channel")
+    ET.SubElement(channel, "title").text = "EAS Consulting Group Blog"
+    ET.SubElement(channel, "link").text = BLOG_URL
+    ET.SubElement(channel, "description").text = (
+        "Unofficial RSS feed generated from the EAS Consulting Group blog page."
+    )
+    ET.SubElement(channel, "lastBuildDate").text = rfc2822(build_dt)
 
+    for title, link, pub_dt in posts:
         # Last-resort assumption: use build time (not accurate, but deterministic)
         if pub_dt is None:
             pub_dt = build_dt
 
-        rss_items.append(
-            f"""
-    <item>
-      <title>{html.escape(title)}</title>
-      <link>{html.escape(link)}</link>
-      <guid isPermaLink="true">{html.escape(link)}</guid>
-      <pubDate>{rfc2822(pub_dt)}</pubDate>
-    </item>""".strip()
-        )
-
-    rss = f"""<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0">
-  <channel>
-    <title>{html.escape("EAS Consulting Group Blog")}</title>
-    <link>{html.escape(BLOG_URL)}</link>
-    <description>{html.escape("Unofficial RSS feed generated from the EAS Consulting Group blog page.")}</description>
-    <lastBuildDate>{rfc2822(build_dt)}</lastBuildDate>
-{chr(10).join(rss_items)}
-  </channel>
-</rss>
-"""
+        item = ET.SubElement(channel, "item")
+        ET.SubElement(item, "title").text = title
+        ET.SubElement(item, "link").text = link
+        ET.SubElement(item, "guid", isPermaLink="true").text = link
+        ET.SubElement(item, "pubDate").text = rfc2822(pub_dt)
+
+    tree = ET.ElementTree(rss)
+    ET.indent(tree)
+    with open("feed.xml", "wb") as f:
+        tree.write(f, encoding="UTF-8", xml_declaration=True)
+        f.write(b"\n")
 
-    with open("feed.xml", "w", encoding="utf-8") as f:
-        f.write(rss)
+    save_cache()
 
     print(f"Wrote feed.xml with {len(posts)} items")
     return 0
@@ -0,0 +1,275 @@
+"""
+Tests for generate_feed.py, run against a local http.server.
+
+    python -m unittest
+"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.error import HTTPError
+
+import generate_feed as gf
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=None, close=False):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Drop the connection without announcing it, like an idle keep-alive
+        # timeout on the server side
+        self.close_connection = close
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, dict(self.headers), self.client_address))
+
+        if self.path.endswith("/ok"):
+            self._send(200, "héllo".encode())
+        elif self.path.endswith("/moved"):
+            self._send(301, headers={"Location": "/ok"})
+        elif self.path.endswith("/boom"):
+            self._send(500, b"oops")
+        elif self.path.endswith("/etag"):
+            if self.headers.get("If-None-Match") == '"v1"':
+                self._send(304)
+            else:
+                body = b'<meta property="article:published_time" content="2024-05-06">'
+                self._send(200, body, headers={"ETag": '"v1"'})
+        elif self.path.endswith("/drop"):
+            self._send(200, b"dropped", close=True)
+        else:
+            self._send(404)
+
+
+class LocalServerTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_port}"
+
+        env = mock.patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        for name in list(os.environ):
+            if name.lower().endswith("_proxy"):
+                del os.environ[name]
+
+        self.addCleanup(self._reset)
+        self._reset()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _reset(self):
+        for conns in gf._POOL.values():
+            for conn in conns:
+                conn.close()
+        gf._POOL.clear()
+        gf._CACHE.clear()
+        gf._CACHE_OUT.clear()
+
+    def connections(self):
+        return {addr for _, _, addr in self.server.requests}
+
+
+class FetchTransportTest(LocalServerTest):
+    def test_keep_alive_reuses_connection(self):
+        for _ in range(3):
+            self.assertEqual(gf.fetch(self.base + "/ok"), "héllo")
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(len(self.connections()), 1)
+
+    def test_follows_redirect(self):
+        self.assertEqual(gf.fetch(self.base + "/moved"), "héllo")
+        self.assertEqual([p for p, _, _ in self.server.requests], ["/moved", "/ok"])
+
+    def test_server_error_raises_http_error(self):
+        with self.assertRaises(HTTPError) as cm:
+            gf.fetch(self.base + "/boom")
+        self.assertEqual(cm.exception.code, 500)
+        # The connection is still usable afterwards
+        self.assertEqual(gf.fetch(self.base + "/ok"), "héllo")
+        self.assertEqual(len(self.connections()), 1)
+
+    def test_retries_after_server_drops_idle_connection(self):
+        self.assertEqual(gf.fetch(self.base + "/drop"), "dropped")
+        self.assertEqual(gf.fetch(self.base + "/ok"), "héllo")
+        self.assertEqual(len(self.connections()), 2)
+
+    def test_fetch_many_keeps_order_and_returns_errors(self):
+        urls = [self.base + "/ok", self.base + "/boom", self.base + "/moved"]
+        results = gf.fetch_many(urls, gf.fetch)
+        self.assertEqual(results[0], "héllo")
+        self.assertIsInstance(results[1], HTTPError)
+        self.assertEqual(results[2], "héllo")
+
+    def test_uses_configured_proxy(self):
+        os.environ["http_proxy"] = self.base
+        self.assertEqual(gf.fetch("http://blog.invalid/ok"), "héllo")
+        self.assertEqual(self.server.requests[0][0], "http://blog.invalid/ok")
+
+    def test_proxied_redirect_and_error(self):
+        os.environ["http_proxy"] = self.base
+        self.assertEqual(gf.fetch("http://blog.invalid/moved"), "héllo")
+        with self.assertRaises(HTTPError) as cm:
+            gf.fetch("http://blog.invalid/boom")
+        self.assertEqual(cm.exception.code, 500)
+
+
+class ConditionalGetCacheTest(LocalServerTest):
+    def setUp(self):
+        super().setUp()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_path = os.path.join(tmp.name, "http_cache.json")
+
+    def next_run(self):
+        # Persist this run's cache and start the next one from disk
+        gf.save_cache(self.cache_path)
+        gf._CACHE.clear()
+        gf._CACHE_OUT.clear()
+        gf.load_cache(self.cache_path)
+
+    def test_304_returns_cached_body_and_date(self):
+        url = self.base + "/etag"
+        self.assertEqual(gf.fetch_pub_dt(url), utc(2024, 5, 6))
+        self.next_run()
+
+        with mock.patch.object(gf, "try_extract_pub_dt_from_post") as extract:
+            self.assertEqual(gf.fetch_pub_dt(url), utc(2024, 5, 6))
+        extract.assert_not_called()
+        self.assertIn("content=", gf.fetch(url))
+
+        sent = [headers.get("If-None-Match") for _, headers, _ in self.server.requests]
+        self.assertEqual(sent, [None, '"v1"', '"v1"'])
+
+    def test_pages_not_fetched_are_pruned(self):
+        gf.fetch(self.base + "/etag")
+        self.next_run()
+        self.next_run()
+        self.assertEqual(gf._CACHE, {})
+
+    def test_malformed_entries_are_dropped(self):
+        url = self.base + "/etag"
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    url: {"etag": '"v1"', "last_modified": ""},
+                    self.base + "/a": ["not", "a", "dict"],
+                    self.base + "/b": {"etag": '"v1"', "body": None},
+                    self.base + "/c": {"etag": 1, "body": "x"},
+                },
+                f,
+            )
+        gf.load_cache(self.cache_path)
+        self.assertEqual(gf._CACHE, {})
+        # Without a usable entry no validators are sent and the page is refetched
+        self.assertIn("content=", gf.fetch(url))
+        self.assertIsNone(self.server.requests[0][1].get("If-None-Match"))
+
+    def test_unreadable_cache_file_is_ignored(self):
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        gf.load_cache(self.cache_path)
+        self.assertEqual(gf._CACHE, {})
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class ListingExtractionTest(unittest.TestCase):
+    def test_date_is_taken_from_own_block_only(self):
+        listing = (
+            '<h2><a href="https://easconsultinggroup.com/a/">A &amp; <b>B</b></a></h2>'
+            "<span>Mar 9, 2023</span>"
+            '<h2><a href="https://easconsultinggroup.com/b/#more">B</a></h2><p>no date</p>'
+            '<h2><a href="https://easconsultinggroup.com/c/">C</a></h2> September 18, 2025'
+            '<h2><a href="https://easconsultinggroup.com/feed/">Feed</a></h2>'
+        )
+        self.assertEqual(
+            gf.extract_posts_from_listing(listing),
+            [
+                ("A & B", "https://easconsultinggroup.com/a/", utc(2023, 3, 9)),
+                ("B", "https://easconsultinggroup.com/b/", None),
+                ("C", "https://easconsultinggroup.com/c/", utc(2025, 9, 18)),
+            ],
+        )
+
+    def test_stops_at_max_items(self):
+        listing = "".join(
+            f'<h2><a href="https://easconsultinggroup.com/p{i}/">P{i}</a></h2>' for i in range(10)
+        )
+        self.assertEqual(len(gf.extract_posts_from_listing(listing, 3)), 3)
+
+
+class PostDateExtractionTest(unittest.TestCase):
+    def test_og_property_preferred_over_name(self):
+        page = (
+            '<meta name="article:published_time" content="2023-05-05">'
+            '<meta property="article:published_time" content="2024-01-01">'
+        )
+        self.assertEqual(gf.try_extract_pub_dt_from_post(page), utc(2024, 1, 1))
+
+    def test_og_name_used_when_property_unparsable(self):
+        page = (
+            '<meta property="article:published_time" content="soon">'
+            '<meta name="article:published_time" content="2023-05-05">'
+        )
+        self.assertEqual(gf.try_extract_pub_dt_from_post(page), utc(2023, 5, 5))
+
+    def test_og_matches_case_insensitively(self):
+        page = '<META PROPERTY="ARTICLE:PUBLISHED_TIME" content="2022-02-02"><time datetime="2020-01-01">'
+        self.assertEqual(gf.try_extract_pub_dt_from_post(page), utc(2022, 2, 2))
+
+    def test_ld_json_type_matches_case_insensitively(self):
+        page = '<script type="application/LD+JSON">{"datePublished": "2023-05-06T07:08:09Z"}</script>'
+        self.assertEqual(gf.try_extract_pub_dt_from_post(page), utc(2023, 5, 6, 7, 8, 9))
+
+
+class FeedOutputTest(unittest.TestCase):
+    def test_main_writes_escaped_feed_with_final_newline(self):
+        listing = (
+            '<h2><a href="https://easconsultinggroup.com/a/">R&amp;D &lt;news&gt;</a></h2> Mar 9, 2023'
+            '<h2><a href="https://easconsultinggroup.com/b/">B</a></h2>'
+        )
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(tmp.name)
+        self.addCleanup(os.chdir, cwd)
+
+        with mock.patch.object(gf, "fetch", return_value=listing), mock.patch.object(
+            gf, "fetch_pub_dt", return_value=utc(2024, 5, 6, 1, 2, 3)
+        ), mock.patch("builtins.print"):
+            self.assertEqual(gf.main(), 0)
+
+        with open("feed.xml", encoding="utf-8") as f:
+            feed = f.read()
+        self.assertTrue(feed.endswith("</rss>\n"))
+        self.assertIn("<title>R&amp;D &lt;news&gt;</title>", feed)
+        self.assertIn("<pubDate>Thu, 09 Mar 2023 00:00:00 +0000</pubDate>", feed)
+        self.assertIn("<pubDate>Mon, 06 May 2024 01:02:03 +0000</pubDate>", feed)
+
+
+if __name__ == "__main__":
+    unittest.main()